@@ -13,7 +13,7 @@ def clear_former_mp_alerts(qs=None):
     if qs is None:
         qs = PoliticianAlert.objects.filter(active=True)
     bad_alerts = [a for a in qs
-        if not a.politician.current_member]
+        if not a.politician.has_current_membership]
     for alert in bad_alerts:
         riding = alert.politician.latest_member.riding
         new_politician = ElectedMember.objects.get(riding=riding, end_date__isnull=True).politician
@@ -172,7 +172,7 @@ def politician_hansard_subscribe(request, signed_key):
         key = TimestampSigner(salt='alerts_pol_subscribe').unsign(signed_key, max_age=60*60*24*90)
         politician_id, _, email = key.partition(',')
         pol = get_object_or_404(Politician, id=politician_id)
-        if not pol.current_member:
+        if not pol.has_current_membership:
             raise Http404
 
         user, created = User.objects.get_or_create(email=email)
@@ -333,7 +333,7 @@ def slugs_for_pols(qs=None):
             
 def wikipedia_from_freebase():
     import freebase
-    for info in PoliticianInfo.sr_objects.filter(schema='freebase_id'):
+    for info in PoliticianInfo.objects.with_politician().filter(schema='freebase_id'):
         query = {
             'id': info.value,
             'key': [{
@@ -350,7 +350,7 @@ def wikipedia_from_freebase():
 def freebase_id_from_parl_id():
     import freebase
     import time
-    for info in PoliticianInfo.sr_objects.filter(schema='parl_id').order_by('value'):
+    for info in PoliticianInfo.objects.with_politician().filter(schema='parl_id').order_by('value'):
         if PoliticianInfo.objects.filter(politician=info.politician, schema='freebase_id').exists():
             continue
         query = {
@@ -0,0 +1,23 @@
+from django.db import migrations, models
+from django.db.models.functions import Lower, Trim
+
+
+def populate_text_value_norm(apps, schema_editor):
+    InternalXref = apps.get_model('core', 'InternalXref')
+    InternalXref.objects.update(text_value_norm=Lower(Trim('text_value')))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_politician_headshot_thumbnail'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='internalxref',
+            name='text_value_norm',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=250),
+        ),
+        migrations.RunPython(populate_text_value_norm, migrations.RunPython.noop),
+    ]
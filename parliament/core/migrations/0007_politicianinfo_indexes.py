@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_internalxref_text_value_norm'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='politicianinfo',
+            index=models.Index(fields=['politician', 'schema'], name='core_polinfo_pol_schema_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='politicianinfo',
+            index=models.Index(condition=models.Q(('schema__in', ['alternate_name', 'parl_mp_id', 'parl_affil_id'])), fields=['schema', 'value'], name='core_polinfo_lookup_idx'),
+        ),
+    ]
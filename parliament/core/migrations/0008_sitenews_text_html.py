@@ -0,0 +1,25 @@
+from django.db import migrations, models
+from markdown import markdown
+
+
+def render_text_html(apps, schema_editor):
+    SiteNews = apps.get_model('core', 'SiteNews')
+    for item in SiteNews.objects.all():
+        item.text_html = markdown(item.text)
+        item.save(update_fields=['text_html'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_politicianinfo_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='sitenews',
+            name='text_html',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.RunPython(render_text_html, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,7 @@
 # coding: utf-8
 
+from concurrent.futures import ThreadPoolExecutor
+import copy
 import datetime
 import re
 from urllib.parse import urljoin
@@ -17,10 +19,13 @@ import lxml.etree
 import lxml.html
 from markdown import markdown
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from PIL import Image, ImageOps
 
 from parliament.core import parsetools
-from parliament.core.utils import memoize_property, ActiveManager, language_property
+from parliament.core.utils import (memoize_property, is_memoized, set_memoized, clear_memoized,
+    ActiveManager, language_property, InstanceCache)
 from parliament.search.index import register_search_model
 
 import logging
@@ -29,10 +34,32 @@ logger = logging.getLogger(__name__)
 #POL_AFFIL_ID_LOOKUP_URL = 'https://www.ourcommons.ca/Parliamentarians/en/members/profileredirect?affiliationId=%s'
 POL_AFFIL_ID_LOOKUP_URL = 'https://apps.ourcommons.ca/ParlDataWidgets/en/aff/%s'
 POL_PERSON_ID_LOOKUP_URL = 'https://www.ourcommons.ca/Members/en/openparliamentdotca-lookup(%s)'
+HTTP_TIMEOUT = 10
+
+# Shared session for ourcommons.ca lookups and headshot downloads, so that
+# backfills reuse keep-alive connections instead of reconnecting every time.
+_http = requests.Session()
+_http.headers['User-Agent'] = 'openparliament.ca'
+_http.mount('https://', HTTPAdapter(pool_maxsize=16, max_retries=Retry(
+    total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504], raise_on_status=False)))
+
+r_profile_url_id = re.compile(r'\((\d+)\)$')
+r_parl_session = re.compile(r'^(\d\d)\D+(\d)\D')
+
+# For the ourcommons.ca MP profile XML. smart_strings=False gives plain strs
+# that don't keep a reference to the whole parsed document.
+xpath_mp_first_name = lxml.etree.XPath('string(MemberOfParliamentRole/PersonOfficialFirstName)',
+    smart_strings=False)
+xpath_mp_last_name = lxml.etree.XPath('string(MemberOfParliamentRole/PersonOfficialLastName)',
+    smart_strings=False)
+xpath_mp_riding = lxml.etree.XPath('string(MemberOfParliamentRole/ConstituencyName)',
+    smart_strings=False)
 
 class InternalXref(models.Model):
     """A general-purpose table for quickly storing internal links."""
     text_value = models.CharField(max_length=250, blank=True, db_index=True)
+    # Stripped, lowercased copy of text_value, for case-insensitive lookups
+    text_value_norm = models.CharField(max_length=250, blank=True, db_index=True, editable=False)
     int_value = models.IntegerField(blank=True, null=True, db_index=True)
     target_id = models.IntegerField(db_index=True)
     
@@ -46,16 +73,29 @@ class InternalXref(models.Model):
     def __str__(self):
         return "%s: %s %s for %s" % (self.schema, self.text_value, self.int_value, self.target_id)
 
+    def save(self, *args, **kwargs):
+        self.text_value_norm = (self.text_value or '').strip().lower()
+        super(InternalXref, self).save(*args, **kwargs)
+
 class PartyManager(models.Manager):
+
+    # Normalized name -> Party, for get_by_name. Party names are near-static,
+    # and importers look them up once per row.
+    _cache = InstanceCache()
     
     def get_by_name(self, name):
-        x = InternalXref.objects.filter(schema='party_names', text_value=name.strip().lower())
-        if len(x) == 0:
-            raise Party.DoesNotExist()
-        elif len(x) > 1:
-            raise Exception("More than one party matched %s" % name.strip().lower())
-        else:
-            return self.get_queryset().get(pk=x[0].target_id)
+        name = name.strip().lower()
+        by_name = PartyManager._cache.get_dict()
+        if name not in by_name:
+            ids = list(InternalXref.objects.filter(schema='party_names', text_value_norm=name
+                ).values_list('target_id', flat=True)[:2])
+            if len(ids) == 0:
+                raise Party.DoesNotExist()
+            elif len(ids) > 1:
+                raise Exception("More than one party matched %s" % name)
+            by_name[name] = self.get_queryset().get(pk=ids[0])
+        # Callers may modify the party they get back
+        return copy.copy(by_name[name])
             
 class Party(models.Model):
     """A federal political party."""
@@ -99,16 +139,19 @@ class Party(models.Model):
     def add_alternate_name(self, name):
         name = name.strip().lower()
         # check if exists
-        x = InternalXref.objects.filter(schema='party_names', text_value=name)
-        if len(x) == 0:
+        x = InternalXref.objects.filter(schema='party_names', text_value_norm=name).first()
+        if x is None:
             InternalXref(schema='party_names', target_id=self.id, text_value=name).save()
         else:
-            if x[0].target_id != self.id:
+            if x.target_id != self.id:
                 raise Exception("Name %s already points to a different party" % name.strip().lower())
                 
     def __str__(self):
         return self.name
 
+PartyManager._cache.invalidate_on(Party)
+PartyManager._cache.invalidate_on(InternalXref, only_if=lambda xref: xref.schema == 'party_names')
+
 class Person(models.Model):
     """Abstract base class for models representing a person."""
     
@@ -127,8 +170,8 @@ class PoliticianManager(models.Manager):
     
     def elected(self):
         """Returns a QuerySet of all politicians that were once elected to office."""
-        return self.get_queryset().annotate(
-            electedcount=models.Count('electedmember')).filter(electedcount__gte=1)
+        return self.get_queryset().filter(models.Exists(
+            ElectedMember.objects.filter(politician=models.OuterRef('pk'))))
             
     def never_elected(self):
         """Returns a QuerySet of all politicians that were never elected as MPs.
@@ -138,8 +181,9 @@ class PoliticianManager(models.Manager):
         
     def current(self):
         """Returns a QuerySet of all current MPs."""
-        return self.get_queryset().filter(electedmember__end_date__isnull=True,
-            electedmember__start_date__isnull=False).distinct()
+        return self.get_queryset().filter(models.Exists(
+            ElectedMember.objects.filter(politician=models.OuterRef('pk'),
+                end_date__isnull=True, start_date__isnull=False)))
         
     def elected_but_not_current(self):
         """Returns a QuerySet of former MPs."""
@@ -148,7 +192,7 @@ class PoliticianManager(models.Manager):
     def filter_by_name(self, name):
         """Returns a list of politicians matching a given name."""
         return [i.politician for i in 
-            PoliticianInfo.sr_objects.filter(schema='alternate_name', value=parsetools.normalizeName(name))]
+            PoliticianInfo.objects.with_politician().filter(schema='alternate_name', value=parsetools.normalizeName(name))]
     
     def get_by_name(self, name, session=None, riding=None, election=None, party=None, saveAlternate=True, strictMatch=False):
         """ Return a Politician by name. Uses a bunch of methods to try and deal with variations in names.
@@ -162,26 +206,24 @@ class PoliticianManager(models.Manager):
         """
         
         # Alternate names for a pol are in the InternalXref table. Assemble a list of possibilities
-        poss = PoliticianInfo.sr_objects.filter(schema='alternate_name', value=parsetools.normalizeName(name))
+        poss = PoliticianInfo.objects.with_politician().filter(schema='alternate_name', value=parsetools.normalizeName(name))
         if len(poss) >= 1:
             # We have one or more results
             if session or riding or party:
-                # We've been given extra criteria -- see if they match
-                result = None
-                for p in poss:
-                    # For each possibility, assemble a list of matching Members
-                    members = ElectedMember.objects.filter(politician=p.politician)
-                    if riding: members = members.filter(riding=riding)
-                    if session: members = members.filter(sessions=session)
-                    if party: members = members.filter(party=party)
-                    if len(members) >= 1:
-                        if result: # we found another match on a previous journey through the loop
-                            # can't disambiguate, raise exception
-                            raise Politician.MultipleObjectsReturned(name)
-                        # We match! Save the result.
-                        result = members[0].politician
-                if result:
-                    return result
+                # We've been given extra criteria -- see which possibilities have
+                # matching Members, in one query
+                members = ElectedMember.objects.filter(politician__in=[p.politician_id for p in poss])
+                if riding: members = members.filter(riding=riding)
+                if session: members = members.filter(sessions=session)
+                if party: members = members.filter(party=party)
+                matches = set(members.values_list('politician_id', flat=True).distinct())
+                if len(matches) > 1:
+                    # can't disambiguate, raise exception
+                    raise Politician.MultipleObjectsReturned(name)
+                elif matches:
+                    # We match!
+                    pol_id = matches.pop()
+                    return next(p.politician for p in poss if p.politician_id == pol_id)
             elif election:
                 raise Exception("Election not implemented yet in Politician get_by_name")
             else:
@@ -192,13 +234,16 @@ class PoliticianManager(models.Manager):
                     return poss[0].politician
         if session and not strictMatch:
             # We couldn't find the pol, but we have the session and riding, so let's give this one more shot
-            # We'll try matching only on last name
-            match = re.search(r'\s([A-Z][\w-]+)$', name.strip()) # very naive lastname matching
-            if match:
-                lastname = match.group(1)
+            # We'll try matching only on last name -- very naively, the final word,
+            # if it's capitalized and made of word characters and hyphens
+            parts = name.strip().rsplit(None, 1)
+            lastname = parts[-1] if len(parts) == 2 else ''
+            if (len(lastname) > 1 and 'A' <= lastname[0] <= 'Z'
+                    and all(c.isalnum() or c in '_-' for c in lastname[1:])):
                 pols = self.get_queryset().filter(name_family=lastname, electedmember__sessions=session).distinct()
                 if riding:
                     pols = pols.filter(electedmember__riding=riding)
+                pols = list(pols[:2])
                 if len(pols) > 1:
                     if riding:
                         raise Exception("DATA ERROR: There appear to be two politicians with the same last name elected to the same riding from the same session... %s %s %s" % (lastname, session, riding))
@@ -220,7 +265,7 @@ class PoliticianManager(models.Manager):
         Find a Politician object, based on the ourcommons.ca person ID.
         """
         try:
-            info = PoliticianInfo.sr_objects.get(schema='parl_mp_id', value=str(parlid))
+            info = PoliticianInfo.objects.with_politician().get(schema='parl_mp_id', value=str(parlid))
             return info.politician
         except PoliticianInfo.DoesNotExist:
             pol, x_mp_id = self._get_pol_from_ourcommons_profile_url(POL_PERSON_ID_LOOKUP_URL % parlid,
@@ -229,7 +274,7 @@ class PoliticianManager(models.Manager):
                 raise Exception("get_by_parl_mp_id: Get for ID %s found ID %s (%s)" %
                     (parlid, x_mp_id, pol))
             pol.set_info('parl_mp_id', parlid, overwrite=False)
-            return self.get_queryset().get(id=pol.id)
+            return pol
             
     def get_by_parl_affil_id(self, parlid, session=None, riding_name=None):
         """
@@ -238,46 +283,97 @@ class PoliticianManager(models.Manager):
         very well exposed. Notably these are the IDs that we get in Hansard XML.
         """
         try:
-            info = PoliticianInfo.sr_objects.get(
+            info = PoliticianInfo.objects.with_politician().get(
                 schema='parl_affil_id', value=str(parlid))
             return info.politician
         except PoliticianInfo.DoesNotExist:
-            resp = requests.get(POL_AFFIL_ID_LOOKUP_URL % parlid)
-            resp.raise_for_status()
-            root = lxml.html.fromstring(resp.text)
-            profile_link = root.cssselect('.mpprofile a')
-            if not profile_link:
-                raise Politician.DoesNotExist("Couldn't resolve affil ID %s" % parlid)
-            if len(profile_link) > 1:
-                raise Exception("Weird scrape: multiple CSS results for ID %s in get_by_parl_affil_id" % parlid)
-            profile_url = urljoin(resp.url, profile_link[0].attrib['href'])
-            pol, parl_mp_id = self._get_pol_from_ourcommons_profile_url(profile_url,
-                                                             session, riding_name)
-            try:
-                mpid_info = PoliticianInfo.objects.get(schema='parl_mp_id', value=str(parl_mp_id))
-                if mpid_info.politician_id != pol.id:
-                    raise Exception("get_by_parl_affil_id: for ID %s found %s, but mp_id %s already used for %s"
-                        % (parlid, pol, parl_mp_id, mpid_info.politician))
-            except PoliticianInfo.DoesNotExist:
-                pol.set_info('parl_mp_id', parl_mp_id, overwrite=False)
-            
-            pol.set_info_multivalued('parl_affil_id', parlid)
-            return self.get_queryset().get(id=pol.id)
+            profile = self._fetch_affil_id_profile(parlid)
+            return self._save_affil_id(parlid, profile, session, riding_name)
+
+    def prefetch_affil_ids(self, parlids, session=None):
+        """
+        Resolves a batch of affiliation IDs, as get_by_parl_affil_id would,
+        and returns a dict of ID -> Politician. IDs we already know take one
+        query; the rest are looked up on ourcommons.ca in parallel.
+        IDs that can't be resolved are left out of the result, for the
+        caller to report.
+        """
+        parlids = set(int(parlid) for parlid in parlids)
+        result = {}
+        for info in PoliticianInfo.objects.with_politician().filter(
+                schema='parl_affil_id', value__in=[str(parlid) for parlid in parlids]):
+            if int(info.value) in result:
+                # get_by_parl_affil_id's .get() would refuse this too
+                raise PoliticianInfo.MultipleObjectsReturned(
+                    "More than one PoliticianInfo for parl_affil_id %s" % info.value)
+            result[int(info.value)] = info.politician
+        missing = parlids - set(result)
+        if missing:
+            # Only the HTTP requests happen in threads; the database work
+            # happens here, on this thread's connection.
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                futures = dict((parlid, executor.submit(self._fetch_affil_id_profile, parlid))
+                    for parlid in missing)
+            for parlid, future in sorted(futures.items()):
+                try:
+                    result[parlid] = self._save_affil_id(parlid, future.result(), session)
+                except Politician.DoesNotExist:
+                    pass
+        return result
+
+    def _fetch_affil_id_profile(self, parlid):
+        """Looks up an affiliation ID on ourcommons.ca, and returns the
+        MP profile data from _fetch_ourcommons_profile. Doesn't touch the database."""
+        resp = _http.get(POL_AFFIL_ID_LOOKUP_URL % parlid, timeout=HTTP_TIMEOUT)
+        resp.raise_for_status()
+        root = lxml.html.fromstring(resp.text)
+        profile_link = root.cssselect('.mpprofile a')
+        if not profile_link:
+            raise Politician.DoesNotExist("Couldn't resolve affil ID %s" % parlid)
+        if len(profile_link) > 1:
+            raise Exception("Weird scrape: multiple CSS results for ID %s in get_by_parl_affil_id" % parlid)
+        profile_url = urljoin(resp.url, profile_link[0].attrib['href'])
+        return self._fetch_ourcommons_profile(profile_url)
+
+    def _save_affil_id(self, parlid, profile, session=None, riding_name=None):
+        """Given the fetched profile for an affiliation ID, finds the Politician
+        and records the ID (and their MP ID) against them."""
+        pol, parl_mp_id = self._get_pol_from_ourcommons_profile(profile, session, riding_name)
+        try:
+            mpid_info = PoliticianInfo.objects.get(schema='parl_mp_id', value=str(parl_mp_id))
+            if mpid_info.politician_id != pol.id:
+                raise Exception("get_by_parl_affil_id: for ID %s found %s, but mp_id %s already used for %s"
+                    % (parlid, pol, parl_mp_id, mpid_info.politician))
+        except PoliticianInfo.DoesNotExist:
+            pol.set_info('parl_mp_id', parl_mp_id, overwrite=False)
+        
+        pol.set_info_multivalued('parl_affil_id', parlid)
+        return pol
 
     def _get_pol_from_ourcommons_profile_url(self, profile_url, session=None, riding_name=None):
-        url_match = re.search(r'\((\d+)\)$', profile_url)
+        return self._get_pol_from_ourcommons_profile(
+            self._fetch_ourcommons_profile(profile_url), session, riding_name)
+
+    def _fetch_ourcommons_profile(self, profile_url):
+        """Fetches an ourcommons.ca MP profile, and returns a
+        (parl_mp_id, name, riding name) tuple. Doesn't touch the database."""
+        url_match = r_profile_url_id.search(profile_url)
         if not url_match:
             raise Exception("Couldn't parse ID out of provided profile URL %s" % profile_url)
         parl_mp_id = url_match.group(1)
         xml_url = profile_url + '/xml'
-        xml_resp = requests.get(xml_url)
-        xml_resp.raise_for_status()
-        xml_doc = lxml.etree.fromstring(xml_resp.content)
-
-        polname = xml_doc.findtext('MemberOfParliamentRole/PersonOfficialFirstName'
-            ) + ' ' + xml_doc.findtext('MemberOfParliamentRole/PersonOfficialLastName')
-        polriding = xml_doc.findtext('MemberOfParliamentRole/ConstituencyName')
-                    
+        with _http.get(xml_url, stream=True, timeout=HTTP_TIMEOUT) as xml_resp:
+            xml_resp.raise_for_status()
+            # Parse straight off the socket rather than buffering the body first
+            xml_resp.raw.decode_content = True
+            xml_doc = lxml.etree.parse(xml_resp.raw).getroot()
+
+        polname = xpath_mp_first_name(xml_doc) + ' ' + xpath_mp_last_name(xml_doc)
+        polriding = xpath_mp_riding(xml_doc)
+        return (parl_mp_id, polname, polriding)
+
+    def _get_pol_from_ourcommons_profile(self, profile, session=None, riding_name=None):
+        (parl_mp_id, polname, polriding) = profile
         try:
             riding = Riding.objects.get_by_name(polriding)
         except Riding.DoesNotExist:
@@ -349,9 +445,13 @@ class Politician(Person):
         if normname not in self.alternate_names():
             self.set_info_multivalued('alternate_name', normname)
 
+    @memoize_property
     def alternate_names(self):
-        """Returns a list of ways of writing this politician's name."""
-        return self.politicianinfo_set.filter(schema='alternate_name').values_list('value', flat=True)
+        """Returns a set of ways of writing this politician's name."""
+        prefetched = self._prefetched_info()
+        if prefetched is not None:
+            return frozenset(i.value for i in prefetched if i.schema == 'alternate_name')
+        return frozenset(self.politicianinfo_set.filter(schema='alternate_name').values_list('value', flat=True))
         
     def add_slug(self):
         """Assigns a slug to this politician, unless there's a conflict."""
@@ -370,10 +470,19 @@ class Politician(Person):
         """If this politician is a current MP, returns the corresponding ElectedMember object.
         Returns False if the politician is not a current MP."""
         try:
-            return ElectedMember.objects.get(politician=self, end_date__isnull=True)
+            return ElectedMember.objects.select_related('party', 'riding').get(
+                politician=self, end_date__isnull=True)
         except ElectedMember.DoesNotExist:
             return False
 
+    @property
+    def has_current_membership(self):
+        """True if this politician is a current MP. Cheaper than current_member
+        when you don't need the ElectedMember object itself."""
+        if is_memoized(self, 'current_member'):
+            return bool(self.current_member)
+        return ElectedMember.objects.filter(politician=self, end_date__isnull=True).exists()
+
     @property
     @memoize_property        
     def latest_member(self):
@@ -424,22 +533,38 @@ class Politician(Person):
             return reverse('politician_contact', kwargs={'pol_slug': self.slug})
         return reverse('politician_contact', kwargs={'pol_id': self.id})
             
+    def _prefetched_info(self):
+        """If politicianinfo_set was loaded with prefetch_related, returns
+        the prefetched PoliticianInfo objects; otherwise None."""
+        return getattr(self, '_prefetched_objects_cache', {}).get('politicianinfo_set')
+
     @memoize_property
+    def _load_info(self):
+        """Fetches this politician's PoliticianInfo rows once, and returns
+        an (info, info_multivalued) tuple of dictionaries built from them."""
+        prefetched = self._prefetched_info()
+        if prefetched is not None:
+            values = [(i.schema, i.value) for i in prefetched]
+        else:
+            values = self.politicianinfo_set.all().values_list('schema', 'value')
+        info = {}
+        info_multi = {}
+        for (schema, value) in values:
+            info[schema] = value
+            info_multi.setdefault(schema, []).append(value)
+        return (info, info_multi)
+
     def info(self):
         """Returns a dictionary of PoliticianInfo attributes for this politician.
         e.g. politician.info()['web_site']
         """
-        return dict([i for i in self.politicianinfo_set.all().values_list('schema', 'value')])
+        return self._load_info()[0]
         
-    @memoize_property
     def info_multivalued(self):
         """Returns a dictionary of PoliticianInfo attributes for this politician,
         where each key is a list of items. This allows more than one value for a
         given key."""
-        info = {}
-        for i in self.politicianinfo_set.all().values_list('schema', 'value'):
-            info.setdefault(i[0], []).append(i[1])
-        return info
+        return self._load_info()[1]
         
     def set_info(self, key, value, overwrite=True):
         try:
@@ -458,26 +583,39 @@ class Politician(Person):
             info = PoliticianInfo(politician=self, schema=key)
         info.value = str(value)
         info.save()
+        self._clear_info_cache()
         
     def set_info_multivalued(self, key, value):
         PoliticianInfo.objects.get_or_create(politician=self, schema=key, value=str(value))
+        if key == 'alternate_name' and is_memoized(self, 'alternate_names'):
+            set_memoized(self, 'alternate_names', self.alternate_names() | {str(value)})
+        self._clear_info_cache()
 
     def del_info(self, key):
         self.politicianinfo_set.filter(schema=key).delete()
+        if key == 'alternate_name':
+            clear_memoized(self, 'alternate_names')
+        self._clear_info_cache()
+
+    def _clear_info_cache(self):
+        """After a PoliticianInfo write, makes info() and info_multivalued()
+        fetch again, rather than from a stale memo or prefetch."""
+        clear_memoized(self, '_load_info')
+        getattr(self, '_prefetched_objects_cache', {}).pop('politicianinfo_set', None)
 
     def get_text_analysis_qs(self, debates_only=False):
         """Return a QuerySet of Statements to be used in text corpus analysis."""
         statements = self.statement_set.filter(procedural=False)
         if debates_only:
             statements = statements.filter(document__document_type='D')
-        if self.current_member:
+        if self.has_current_membership:
             # For current members, we limit to the last two years for better
             # comparison.
             statements = statements.filter(time__gte=datetime.datetime.now() - datetime.timedelta(weeks=100))
         return statements
 
     def download_headshot(self, url):
-        resp = requests.get(url)
+        resp = _http.get(url, timeout=HTTP_TIMEOUT)
         resp.raise_for_status()
         file = ContentFile(resp.content)
         pil_img = Image.open(BytesIO(resp.content))
@@ -503,7 +641,8 @@ class Politician(Person):
 
     @classmethod
     def search_get_qs(cls):
-        return cls.objects.elected()
+        # search_dict() needs alternate_names()
+        return cls.objects.elected().prefetch_related('politicianinfo_set')
     
     def search_should_index(self):
         # Only index politicians who've been elected
@@ -533,11 +672,11 @@ class Politician(Person):
         return d
 
 class PoliticianInfoManager(models.Manager):
-    """Custom manager ensures we always pull in the politician FK."""
-    
-    def get_queryset(self):
-        return super(PoliticianInfoManager, self).get_queryset()\
-            .select_related('politician')
+
+    def with_politician(self):
+        """Returns a QuerySet that pulls in the politician FK, for callers
+        that are going to use it."""
+        return self.get_queryset().select_related('politician')
 
 # Not necessarily a full list           
 POLITICIAN_INFO_SCHEMAS = (
@@ -557,8 +696,16 @@ class PoliticianInfo(models.Model):
 
     created = models.DateTimeField(blank=True, null=True, default=datetime.datetime.now)
     
-    objects = models.Manager()
-    sr_objects = PoliticianInfoManager()
+    objects = PoliticianInfoManager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['politician', 'schema'], name='core_polinfo_pol_schema_idx'),
+            # For looking politicians up by ID or name. value is an unbounded
+            # TextField, so only index the schemas with short values.
+            models.Index(fields=['schema', 'value'], name='core_polinfo_lookup_idx',
+                condition=models.Q(schema__in=['alternate_name', 'parl_mp_id', 'parl_affil_id'])),
+        ]
 
     def __str__(self):
         return "%s: %s" % (self.politician, self.schema)
@@ -568,6 +715,12 @@ class PoliticianInfo(models.Model):
         return int(self.value)
 
 class SessionManager(models.Manager):
+
+    # pk -> Session. There are only a few dozen sessions, and importers resolve
+    # them over and over, so the lookup methods below work from this in-process
+    # copy of the table, falling back to the database when it doesn't have
+    # an answer.
+    _cache = InstanceCache()
     
     def with_bills(self):
         return self.get_queryset().filter(bill__number_only__gt=1).distinct()
@@ -575,17 +728,42 @@ class SessionManager(models.Manager):
     def current(self):
         return self.get_queryset().order_by('-start')[0]
 
+    def _cached(self):
+        return SessionManager._cache.get_dict(
+            load=lambda: ((s.pk, s) for s in self.get_queryset().all()))
+
+    def _get_cached(self, matches, qs):
+        if len(matches) == 1:
+            return copy.copy(matches[0])
+        # Nothing (or too much) in the cache -- let the database decide, or raise
+        return qs.get()
+
     def get_by_date(self, date):
-        return self.filter(models.Q(end__isnull=True) | models.Q(end__gte=date))\
-            .get(start__lte=date)
+        qs = self.filter(models.Q(end__isnull=True) | models.Q(end__gte=date), start__lte=date)
+        if isinstance(date, datetime.datetime):
+            date = date.date()
+        elif not isinstance(date, datetime.date):
+            # e.g. a date string; leave it to the database to interpret
+            return qs.get()
+        matches = [s for s in self._cached().values()
+            if s.start <= date and (s.end is None or s.end >= date)]
+        return self._get_cached(matches, qs)
+
+    def get_by_parl_session(self, parliamentnum, sessnum):
+        """Given e.g. 41, 1, returns the 1st session of the 41st Parliament."""
+        parliamentnum, sessnum = int(parliamentnum), int(sessnum)
+        matches = [s for s in self._cached().values()
+            if s.parliamentnum == parliamentnum and s.sessnum == sessnum]
+        return self._get_cached(matches, self.filter(parliamentnum=parliamentnum, sessnum=sessnum))
 
     def get_from_string(self, string):
         """Given a string like '41st Parliament, 1st Session, returns the session."""
-        match = re.search(r'^(\d\d)\D+(\d)\D', string)
+        match = r_parl_session.search(string)
         if not match:
             raise ValueError("Could not find parl/session in %s" % string)
         pk = match.group(1) + '-' + match.group(2)
-        return self.get_queryset().get(pk=pk)
+        session = self._cached().get(pk)
+        return self._get_cached([session] if session else [], self.filter(pk=pk))
 
 class Session(models.Model):
     "A session of Parliament."
@@ -607,6 +785,8 @@ class Session(models.Model):
         
     def has_votes(self):
         return bool(self.votequestion_set.all().count())
+
+SessionManager._cache.invalidate_on(Session)
     
 class RidingManager(models.Manager):
     
@@ -634,12 +814,22 @@ class RidingManager(models.Manager):
         'sint-hubert': 'saint-hubert',
         #'edmonton-mill-woods-beaumont': 'edmonton-beaumont',
     }
+
+    # slug -> Riding, for get_by_name. The table is small and near-static,
+    # and importers look up ridings by name constantly.
+    _cache = InstanceCache()
     
     def get_by_name(self, name):
         slug = parsetools.slugify(name)
         if slug in RidingManager.FIX_RIDING:
             slug = RidingManager.FIX_RIDING[slug]
-        return self.get_queryset().get(slug=slug)
+        by_slug = RidingManager._cache.get_dict(
+            load=lambda: ((r.slug, r) for r in self.get_queryset().all()))
+        if slug not in by_slug:
+            # Could have been added by another process
+            by_slug[slug] = self.get_queryset().get(slug=slug)
+        # Callers sometimes modify the riding they get back
+        return copy.copy(by_slug[slug])
 
 if settings.LANGUAGE_CODE.startswith('fr'):
     PROVINCE_CHOICES = (
@@ -703,8 +893,15 @@ class Riding(models.Model):
         
     def __str__(self):
         return "%s (%s)" % (self.dashed_name, self.get_province_display())
+
+RidingManager._cache.invalidate_on(Riding)
         
 class ElectedMemberManager(models.Manager):
+
+    def with_related(self):
+        """Returns a QuerySet that pulls in the politician, party and riding FKs,
+        which are needed whenever an ElectedMember is displayed."""
+        return self.get_queryset().select_related('politician', 'party', 'riding')
     
     def current(self):
         return self.get_queryset().filter(end_date__isnull=True)
@@ -724,10 +921,10 @@ class ElectedMemberManager(models.Manager):
         else:
             # In the case of floor crossers, there may be more than one ElectedMember
             # We haven't been given a date, so just return the first EM
-            qs = self.get_queryset().filter(politician=politician, sessions=session).order_by('-start_date')
-            if not len(qs):
+            em = self.get_queryset().filter(politician=politician, sessions=session).order_by('-start_date').first()
+            if em is None:
                 raise ElectedMember.DoesNotExist("No elected member for %s, session %s" % (politician, session))
-            return qs[0]
+            return em
     
 class ElectedMember(models.Model):
     """Represents one person, elected to a given riding for a given party."""
@@ -778,13 +975,20 @@ class SiteNews(models.Model):
     date = models.DateTimeField(default=datetime.datetime.now)
     title = models.CharField(max_length=200)
     text = models.TextField()
+    # Rendered version of the markdown in text, filled in on save
+    text_html = models.TextField(blank=True, editable=False)
     active = models.BooleanField(default=True)
     
     objects = models.Manager()
     public = ActiveManager()
 
+    def save(self, *args, **kwargs):
+        self.text_html = markdown(self.text)
+        super(SiteNews, self).save(*args, **kwargs)
+
     def html(self):
-        return mark_safe(markdown(self.text))
+        # Fall back to rendering for rows saved without going through save()
+        return mark_safe(self.text_html or markdown(self.text))
     
     class Meta:
         ordering = ('-date',)
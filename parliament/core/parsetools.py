@@ -1,5 +1,6 @@
 import re, unicodedata, decimal
 import datetime
+from functools import lru_cache
 
 r_politicalpost = re.compile(r'(Minister|Leader|Secretary|Solicitor|Attorney|Speaker|Deputy |Soliciter|Chair |Parliamentary|President |for )')
 r_honorific = re.compile(r'^(Mr\.?|Mrs\.?|Ms\.?|Miss\.?|Hon\.?|Right Hon\.|The|A|An\.?|Some|M\.|One|Santa|Acting|L\'hon\.|Assistant|Mme)\s(.+)$', re.DOTALL | re.UNICODE)
@@ -50,6 +51,7 @@ def tameWhitespace(s):
 def sane_quotes(s):
     return s.replace('``', '"').replace("''", '"')
     
+@lru_cache(maxsize=2048)
 def slugify(s, allow_numbers=False):
     if allow_numbers:
         pattern = r'[^a-zA-Z0-9]'
@@ -0,0 +1,119 @@
+import datetime
+
+from django.test import TestCase
+
+from parliament.core.models import (InternalXref, Party, PartyManager, Politician,
+    Riding, RidingManager, Session, SessionManager)
+
+class RidingCacheTests(TestCase):
+
+    fixtures = ['ridings']
+
+    def setUp(self):
+        RidingManager._cache.clear()
+
+    def test_get_by_name(self):
+        avalon = Riding.objects.get_by_name('Avalon')
+        self.assertEqual(avalon.pk, 10001)
+        with self.assertNumQueries(0):
+            self.assertEqual(Riding.objects.get_by_name('Avalon'), avalon)
+        with self.assertRaises(Riding.DoesNotExist):
+            Riding.objects.get_by_name('Nowhere in particular')
+
+    def test_returns_copy(self):
+        avalon = Riding.objects.get_by_name('Avalon')
+        avalon.name_en = 'Changed but not saved'
+        again = Riding.objects.get_by_name('Avalon')
+        self.assertIsNot(again, avalon)
+        self.assertEqual(again.name_en, 'Avalon')
+
+    def test_sees_saved_changes(self):
+        avalon = Riding.objects.get_by_name('Avalon')
+        avalon.name_en = 'Avalon Peninsula'
+        avalon.save()
+        self.assertEqual(Riding.objects.get_by_name('Avalon').name_en, 'Avalon Peninsula')
+
+    def test_sees_queryset_deletes(self):
+        Riding.objects.get_by_name('Avalon')
+        Riding.objects.filter(slug='avalon').delete()
+        with self.assertRaises(Riding.DoesNotExist):
+            Riding.objects.get_by_name('Avalon')
+
+
+class PartyCacheTests(TestCase):
+
+    fixtures = ['parties']
+
+    def setUp(self):
+        PartyManager._cache.clear()
+        self.party = Party.objects.get(pk=1)
+        InternalXref.objects.create(schema='party_names', text_value='Conservative', target_id=1)
+
+    def test_get_by_name(self):
+        self.assertEqual(Party.objects.get_by_name(' conservative '), self.party)
+        with self.assertNumQueries(0):
+            self.assertEqual(Party.objects.get_by_name('Conservative'), self.party)
+        with self.assertRaises(Party.DoesNotExist):
+            Party.objects.get_by_name('Whig')
+
+    def test_invalidation(self):
+        Party.objects.get_by_name('Conservative')
+        InternalXref.objects.create(schema='edid_postcode', text_value='K1A0A6', target_id=35075)
+        with self.assertNumQueries(0):
+            Party.objects.get_by_name('Conservative')
+        InternalXref.objects.filter(schema='party_names').delete()
+        with self.assertRaises(Party.DoesNotExist):
+            Party.objects.get_by_name('Conservative')
+
+class SessionCacheTests(TestCase):
+
+    fixtures = ['sessions']
+
+    def setUp(self):
+        SessionManager._cache.clear()
+
+    def test_cache_hits(self):
+        Session.objects.get_from_string('40th Parliament, 3rd Session')
+        with self.assertNumQueries(0):
+            self.assertEqual(Session.objects.get_from_string('40th Parliament, 2nd Session').pk, '40-2')
+            self.assertEqual(Session.objects.get_by_parl_session('40', '1').pk, '40-1')
+            self.assertEqual(Session.objects.get_by_date(datetime.date(2009, 6, 1)).pk, '40-2')
+            self.assertEqual(Session.objects.get_by_date(datetime.datetime(2011, 1, 1, 12)).pk, '40-3')
+
+    def test_cache_misses(self):
+        self.assertEqual(Session.objects.get_by_date('2009-06-01').pk, '40-2')
+        with self.assertRaises(Session.DoesNotExist):
+            Session.objects.get_from_string('99th Parliament, 1st Session')
+        # bulk_create sends no signals, like a session added by another process
+        Session.objects.bulk_create([Session(id='41-1', name='41st Parliament, 1st Session',
+            start=datetime.date(2011, 6, 2), parliamentnum=41, sessnum=1)])
+        self.assertEqual(Session.objects.get_by_parl_session(41, 1).pk, '41-1')
+
+    def test_invalidation(self):
+        session = Session.objects.get_from_string('40th Parliament, 3rd Session')
+        session.end = datetime.date(2011, 3, 26)
+        session.save()
+        with self.assertRaises(Session.DoesNotExist):
+            Session.objects.get_by_date(datetime.date(2011, 6, 1))
+        Session.objects.filter(pk='40-2').delete()
+        with self.assertRaises(Session.DoesNotExist):
+            Session.objects.get_from_string('40th Parliament, 2nd Session')
+
+
+class PoliticianInfoTests(TestCase):
+
+    fixtures = ['parties', 'ridings', 'sessions', 'politicians']
+
+    def test_info_sees_writes(self):
+        for pol in (Politician.objects.get(slug='hedy-fry'),
+                Politician.objects.prefetch_related('politicianinfo_set').get(slug='hedy-fry')):
+            self.assertEqual(pol.info()['twitter'], 'HedyFry')
+            pol.set_info('twitter', 'hedyfry')
+            self.assertEqual(pol.info()['twitter'], 'hedyfry')
+            pol.set_info_multivalued('parl_affil_id', 100)
+            self.assertIn('100', pol.info_multivalued()['parl_affil_id'])
+            pol.del_info('parl_affil_id')
+            self.assertNotIn('parl_affil_id', pol.info_multivalued())
+            pol.del_info('twitter')
+            self.assertNotIn('twitter', pol.info())
+            pol.set_info('twitter', 'HedyFry')
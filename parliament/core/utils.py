@@ -1,9 +1,11 @@
 import json
+import time
 import urllib.request, urllib.parse, urllib.error
 import urllib.request, urllib.error, urllib.parse
 from functools import wraps
 
 from django.db import models
+from django.db.models import signals
 from django.conf import settings
 from django.contrib import staticfiles
 from django.urls import reverse
@@ -16,10 +18,13 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def _memoize_cacheattr(name):
+    return '_cache_' + name
+
 def memoize_property(target):
     """Caches the result of a method that takes no arguments."""
     
-    cacheattr = '_cache_' + target.__name__
+    cacheattr = _memoize_cacheattr(target.__name__)
     
     @wraps(target)
     def wrapped(self):
@@ -28,6 +33,57 @@ def memoize_property(target):
         return getattr(self, cacheattr)
     return wrapped
 
+def is_memoized(obj, name):
+    """True if the memoize_property method called name has already
+    been computed, and cached, on obj."""
+    return hasattr(obj, _memoize_cacheattr(name))
+
+def set_memoized(obj, name, value):
+    """Replaces the cached result of the memoize_property method called name."""
+    setattr(obj, _memoize_cacheattr(name), value)
+
+def clear_memoized(obj, name):
+    """Forgets the cached result, if any, of the memoize_property method called name."""
+    obj.__dict__.pop(_memoize_cacheattr(name), None)
+
+class InstanceCache(object):
+    """A process-level dict of model instances, for small tables that rarely
+    change but get looked up constantly (e.g. by importers).
+
+    The dict is emptied whenever an instance of one of the models passed to
+    invalidate_on() is saved or deleted, and otherwise after max_age seconds,
+    so changes made by other processes or by QuerySet.update() show up too."""
+
+    def __init__(self, max_age=600):
+        self.max_age = max_age
+        self.clear()
+
+    def clear(self, **kwargs):
+        self._data = {}
+        self._loaded = False
+        self._created = time.monotonic()
+
+    def get_dict(self, load=None):
+        """Returns the cached dict. If load is given and the dict has been
+        cleared or has expired, first refills it from load(), which should
+        return (key, value) pairs."""
+        if time.monotonic() - self._created > self.max_age:
+            self.clear()
+        if load is not None and not self._loaded:
+            self._data.update(load())
+            self._loaded = True
+        return self._data
+
+    def invalidate_on(self, *model_classes, only_if=None):
+        """If only_if is given, only saves and deletes of instances for
+        which only_if(instance) is true empty the dict."""
+        def receiver(sender, instance, **kwargs):
+            if only_if is None or only_if(instance):
+                self.clear()
+        for model_cls in model_classes:
+            signals.post_save.connect(receiver, sender=model_cls, weak=False)
+            signals.post_delete.connect(receiver, sender=model_cls, weak=False)
+
 def language_property(fieldname):
     if settings.LANGUAGE_CODE.startswith('fr'):
         fieldname = fieldname + '_fr'
@@ -10,7 +10,6 @@ from django.views.decorators.cache import never_cache
 from parliament.core.models import Session, SiteNews
 from parliament.bills.models import VoteQuestion
 from parliament.hansards.models import Document
-from parliament.core.templatetags.markup import markdown
 from parliament.text_analysis.models import TextAnalysis
 
 def home(request):
@@ -72,7 +71,7 @@ class SiteNewsFeed(Feed):
         return item.title
         
     def item_description(self, item):
-        return markdown(item.text)
+        return item.html()
         
     def item_link(self):
         return 'http://openparliament.ca/'
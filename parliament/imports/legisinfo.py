@@ -112,8 +112,7 @@ def import_bill_by_id(legisinfo_id):
     assert len(rj) == 1
     bd = BillData(rj[0])
 
-    session = Session.objects.get(parliamentnum=bd['ParliamentNumber'],
-        sessnum=bd['SessionNumber'])
+    session = Session.objects.get_by_parl_session(bd['ParliamentNumber'], bd['SessionNumber'])
     # print "Importing bill ID %s" % legisinfo_id
     return _import_bill(bd, session)
 
@@ -66,6 +66,17 @@ def import_document(document, interactive=True, reimport_preserving_sequence=Fal
 
     statements = []
 
+    # Resolve all the speakers up front, so any affiliation IDs we haven't
+    # seen before can be looked up on ourcommons.ca in parallel
+    speaker_ids = set()
+    for pstate in pdoc_en.statements:
+        if pstate.meta.get('person_id') and not pstate.meta.get('person_type'):
+            try:
+                speaker_ids.add(int(pstate.meta['person_id']))
+            except ValueError:
+                pass
+    speakers = Politician.objects.prefetch_affil_ids(speaker_ids, session=document.session)
+
     for pstate in pdoc_en.statements:
         s = Statement(
             document=document,
@@ -95,10 +106,10 @@ def import_document(document, interactive=True, reimport_preserving_sequence=Fal
         if s.who_hocid and not pstate.meta.get('person_type'):
             # At the moment. person_type is only set if we know the person
             # is a non-politician. This might change...
-            try:
-                s.politician = Politician.objects.get_by_parl_affil_id(s.who_hocid, session=document.session)
+            if s.who_hocid in speakers:
+                s.politician = speakers[s.who_hocid]
                 s.member = ElectedMember.objects.get_by_pol(s.politician, date=document.date)
-            except Politician.DoesNotExist:
+            else:
                 logger.info("Could not resolve speaking politician ID %s for %r" % (s.who_hocid, s.who))
 
         s._related_pols = set()
@@ -30,9 +30,9 @@ def import_votes():
     votelist = root.findall('Vote')
     for vote in votelist:
         votenumber = int(vote.findtext('DecisionDivisionNumber'))
-        session = Session.objects.get(
-            parliamentnum=int(vote.findtext('ParliamentNumber')),
-            sessnum=int(vote.findtext('SessionNumber'))
+        session = Session.objects.get_by_parl_session(
+            vote.findtext('ParliamentNumber'),
+            vote.findtext('SessionNumber')
         )
         if VoteQuestion.objects.filter(session=session, number=votenumber).count():
             continue
@@ -1,6 +1,10 @@
+import io
+from unittest import mock
+
 from django.test import TestCase
 
-from parliament.core.models import Politician
+from parliament.core.models import (Politician, PoliticianInfo, Session,
+    PartyManager, RidingManager, SessionManager)
 
 class SmokeTests(TestCase):
     
@@ -19,4 +23,68 @@ class SmokeTests(TestCase):
         rona = Politician.objects.get_by_name('Rona Ambrose')
         
         self.assertContains(self.client.get('/politicians/%s/rss/statements/' % rona.id), 'Rona ')
-        self.assertContains(self.client.get('/politicians/%s/rss/activity/' % rona.id), 'Rona ')
\ No newline at end of file
+        self.assertContains(self.client.get('/politicians/%s/rss/activity/' % rona.id), 'Rona ')
+
+AFFIL_PAGES = {
+    'https://apps.ourcommons.ca/ParlDataWidgets/en/aff/200':
+        '<html><body><div class="mpprofile"><a href="/Members/en/rona-ambrose(25524)">Rona Ambrose</a></div></body></html>',
+    'https://apps.ourcommons.ca/ParlDataWidgets/en/aff/300':
+        '<html><body><p>Not found</p></body></html>',
+    'https://apps.ourcommons.ca/Members/en/rona-ambrose(25524)/xml':
+        '<Profile><MemberOfParliamentRole><PersonOfficialFirstName>Rona</PersonOfficialFirstName>'
+        '<PersonOfficialLastName>Ambrose</PersonOfficialLastName>'
+        '<ConstituencyName>Edmonton--Spruce Grove</ConstituencyName></MemberOfParliamentRole></Profile>',
+}
+
+class FakeResponse(object):
+
+    def __init__(self, url, **kwargs):
+        self.url = url
+        self.text = AFFIL_PAGES[url]
+        self.raw = io.BytesIO(self.text.encode('utf8'))
+
+    def raise_for_status(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+@mock.patch('parliament.core.models._http.get', side_effect=FakeResponse)
+class AffilIDTests(TestCase):
+
+    fixtures = ['parties', 'ridings', 'sessions', 'politicians']
+
+    def setUp(self):
+        PartyManager._cache.clear()
+        RidingManager._cache.clear()
+        SessionManager._cache.clear()
+        self.hedy = Politician.objects.get_by_name('Hedy Fry')
+        self.hedy.set_info_multivalued('parl_affil_id', 100)
+
+    def test_prefetch_affil_ids(self, http_get):
+        result = Politician.objects.prefetch_affil_ids(['100', 200, 300],
+            session=Session.objects.get(pk='40-3'))
+        self.assertEqual(set(result), {100, 200})
+        self.assertEqual(result[100], self.hedy)
+        rona = Politician.objects.get_by_name('Rona Ambrose')
+        self.assertEqual(result[200], rona)
+        self.assertEqual(http_get.call_count, 3)
+
+        self.assertEqual(rona.info()['parl_mp_id'], '25524')
+        self.assertIn('200', rona.info_multivalued()['parl_affil_id'])
+
+        # Now that it's saved, it doesn't need another request
+        http_get.reset_mock()
+        self.assertEqual(Politician.objects.prefetch_affil_ids([200]), {200: rona})
+        http_get.assert_not_called()
+
+    def test_prefetch_duplicate_affil_id(self, http_get):
+        rona = Politician.objects.get_by_name('Rona Ambrose')
+        rona.set_info_multivalued('parl_affil_id', 100)
+        with self.assertRaises(PoliticianInfo.MultipleObjectsReturned):
+            Politician.objects.prefetch_affil_ids([100])
+        with self.assertRaises(PoliticianInfo.MultipleObjectsReturned):
+            Politician.objects.get_by_parl_affil_id(100)
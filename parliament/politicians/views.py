@@ -228,7 +228,7 @@ class PoliticianMembershipView(ModelDetailView):
     resource_name = 'Politician membership'
 
     def get_object(self, request, member_id):
-        return ElectedMember.objects.select_related('party', 'riding', 'politician').get(id=member_id)
+        return ElectedMember.objects.with_related().get(id=member_id)
 
 
 class PoliticianMembershipListView(ModelListView):
@@ -236,7 +236,7 @@ class PoliticianMembershipListView(ModelListView):
     resource_name = 'Politician memberships'
 
     def get_qs(self, request):
-        return ElectedMember.objects.all().select_related('party', 'riding', 'politician')
+        return ElectedMember.objects.with_related()
 
 
 class PoliticianStatementFeed(Feed):
@@ -110,7 +110,7 @@ def try_postcode_first(request):
             mark_safe("""We’re having trouble figuring out where that postcode is.
                 Try asking <a href="http://elections.ca/">Elections Canada</a> who your MP is."""))
     try:
-        member = ElectedMember.objects.get(end_date__isnull=True, riding__edid=edid)
+        member = ElectedMember.objects.select_related('politician').get(end_date__isnull=True, riding__edid=edid)
         return adaptive_redirect(request, member.politician.get_absolute_url())
     except ElectedMember.DoesNotExist:
         return flatpage_response(request, "Ain’t nobody lookin’ out for you",